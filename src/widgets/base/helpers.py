@@ -1,25 +1,54 @@
 import binascii
+from functools import lru_cache
 from typing import Any
-from jinja2 import Environment, PackageLoader
+from jinja2 import Environment, FileSystemBytecodeCache
+from jinja2 import PackageLoader, Template
 import json
+import numpy as np
 import pandas as pd
 from widgets.base.exceptions import ResourceConfigurationException
 import zlib
 
 
+@lru_cache(maxsize=None)
+def _template_environment() -> Environment:
+    """
+    Return the jinja2 environment for the templates in this library.
+    The environment is set up once, and it keeps each template
+    compiled after its first use.
+    """
+
+    # Keep the compiled templates on disk (in a per-user temp folder),
+    # so that new processes (e.g. each CLI launch) can skip compiling them
+    try:
+        bytecode_cache = FileSystemBytecodeCache()
+    # If no temp folder can be used, just compile the templates in memory
+    except (OSError, RuntimeError):
+        bytecode_cache = None
+
+    return Environment(
+        loader=PackageLoader("widgets", encoding="utf-8"),
+        # The packaged templates do not change while the library is loaded
+        auto_reload=False,
+        bytecode_cache=bytecode_cache
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_template(template_name: str) -> Template:
+    """Return a compiled template, loading it only on first use."""
+
+    return _template_environment().get_template(template_name)
+
+
 def render_template(template_name: str, **kwargs):
     """Return a jinja2 template defined in this library."""
 
-    # Set up the jinja2 environment
-    env = Environment(
-        loader=PackageLoader("widgets")
-    )
-
     # Get the template being used
-    template = env.get_template(template_name)
+    template = _get_template(template_name)
 
-    # Render the template
-    return template.render(**kwargs)
+    # Render the template, passing the arguments as a single mapping
+    return template.render(kwargs)
 
 
 def compress_string(string_to_compress: str):
@@ -97,10 +126,33 @@ def parse_dataframe_string(value) -> pd.DataFrame:
     return value
 
 
+def _dataframe_split_dict(val: pd.DataFrame) -> dict:
+    """
+    Convert a DataFrame to a dict with the "split" orientation.
+    If every column shares a single numeric dtype, the values are
+    converted to lists in one pass by numpy, rather than boxing
+    each row individually.
+    """
+
+    # If all of the columns have the same numpy numeric dtype
+    dtypes = set(val.dtypes)
+    if len(dtypes) == 1:
+        dtype = dtypes.pop()
+        if isinstance(dtype, np.dtype) and dtype.kind in "biuf":
+            return dict(
+                index=val.index.tolist(),
+                columns=val.columns.tolist(),
+                data=val.values.tolist()
+            )
+
+    # Otherwise, fall back to the generic conversion
+    return val.to_dict(orient="split")
+
+
 def encode_dataframe_string(val: pd.DataFrame) -> str:
 
     # Convert to dict
-    val_dict = val.to_dict(orient="split")
+    val_dict = _dataframe_split_dict(val)
     # Convert to string
     val_str = json.dumps(val_dict)
     # Compress the string
@@ -37,7 +37,7 @@ def load_widget(url: str, widget_name: str) -> Widget:
     _load_module(url)
 
     # Get the widget defined in that module
-    widget = sys.modules["imported_widget"].__dict__.get(widget_name)
+    widget = getattr(sys.modules["imported_widget"], widget_name, None)
 
     # If that widget was not defined
     if widget is None:
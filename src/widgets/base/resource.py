@@ -2,11 +2,62 @@ from copy import deepcopy
 from inspect import getmro, getsource, isfunction, signature
 from typing import Any, Dict, Generator, List, Union
 import numpy as np
+from weakref import WeakKeyDictionary
 from widgets.base.exceptions import ResourceConfigurationException
 from widgets.base.exceptions import ResourceExecutionException
 from widgets.base.exceptions import CLIExecutionException
 from widgets.base.helpers import render_template
 
+# Attribute values of these types are never modified in place,
+# and so they can be assigned without being copied
+_IMMUTABLE_TYPES = (str, int, float, bool, bytes, type(None))
+
+# Sentinel used to detect attributes which are not defined
+_MISSING = object()
+
+
+def _copy_attribute(val: Any) -> Any:
+    """Return a copy of an attribute value, if it could be modified."""
+
+    if type(val) in _IMMUTABLE_TYPES:
+        return val
+    return deepcopy(val)
+
+
+# Per-class results of source introspection, which are released along
+# with the class (e.g. the classes defined in __main__ on each rerun)
+_INIT_PARAM_NAMES: 'WeakKeyDictionary[type, tuple]' = WeakKeyDictionary()
+_FUNCTIONS_SOURCE: 'WeakKeyDictionary[type, str]' = WeakKeyDictionary()
+
+
+def _init_param_names(cls) -> tuple:
+    """Return the names of the parameters of cls.__init__ (once per class)."""
+
+    names = _INIT_PARAM_NAMES.get(cls)
+    if names is None:
+        names = tuple(signature(cls.__init__).parameters.keys())
+        _INIT_PARAM_NAMES[cls] = names
+
+    return names
+
+
+def _class_functions_source(cls) -> str:
+    """
+    Return the source code of all functions defined by a class,
+    reading the source file once per class.
+    """
+
+    source = _FUNCTIONS_SOURCE.get(cls)
+    if source is None:
+        source = "\n\n".join([
+            getsource(val)
+            for _, val in cls.__dict__.items()
+            if isfunction(val)
+        ])
+        _FUNCTIONS_SOURCE[cls] = source
+
+    return source
+
 
 class Resource:
     """
@@ -62,7 +113,7 @@ class Resource:
         # If a value was not provided
         else:
             # Assign a copy of the class attribute
-            self.value = deepcopy(self.__class__.value)
+            self.value = _copy_attribute(self.__class__.value)
 
         # If no label is provided
         if label is None:
@@ -73,25 +124,25 @@ class Resource:
             # If the class does have a label defined
             else:
                 # Assign it
-                self.label = deepcopy(self.__class__.label)
+                self.label = _copy_attribute(self.__class__.label)
 
         # If a label is provided
         else:
             # Assign it to the class
-            self.label = deepcopy(label)
+            self.label = _copy_attribute(label)
 
         # Assign the help text, if any is provided
         if help is not None:
-            self.help = deepcopy(help)
+            self.help = _copy_attribute(help)
         # Otherwise default to the class attribute
         else:
-            self.help = deepcopy(self.__class__.help)
+            self.help = _copy_attribute(self.__class__.help)
 
         # Any additional keyword arguments
         for attr, val in kwargs.items():
 
             # Will be attached to this object
-            self.__dict__[attr] = deepcopy(val)
+            setattr(self, attr, _copy_attribute(val))
 
         # Attach the children
         self._attach_children(children)
@@ -195,10 +246,11 @@ class Resource:
     def _root(self) -> 'Resource':
         """Return the recursive parent element which does not have a parent."""
 
-        if self.parent is None:
-            return self
-        else:
-            return self.parent._root()
+        # Follow the chain of parents until reaching the top
+        r = self
+        while r.parent is not None:
+            r = r.parent
+        return r
 
     def _path_to_root(self) -> List[str]:
         """
@@ -206,9 +258,13 @@ class Resource:
         and all of its parent elements.
         """
 
+        # Append each id while following the chain of parents
+        # (rather than copying the path of every parent into this one)
         path = [self.id]
-        if self.parent is not None:
-            path.extend(self.parent._path_to_root())
+        r = self.parent
+        while r is not None:
+            path.append(r.id)
+            r = r.parent
         return path
 
     def _assert_isinstance(self, cls, case=True, parent=False):
@@ -268,13 +324,11 @@ class Resource:
     def source_init_params(self, cls, skip=["self", "kwargs"]):
         """Format the set of params used to initialize the object."""
 
-        # Get the signature of the initialization function
-        sig = signature(cls.__init__)
-
         # Build up the parameters to use to invoke the object
         params = {}
 
-        for kw in sig.parameters.keys():
+        # Using the parameters of the initialization function
+        for kw in _init_param_names(cls):
             if kw in skip:
                 continue
             else:
@@ -315,29 +369,35 @@ class Resource:
             ).values())[::-1]
         )
 
-    def _recursive_source(self, gathered_source=dict()) -> dict:
+    def _recursive_source(
+        self,
+        gathered_source: Union[dict, None] = None
+    ) -> dict:
         """
         Recursively traverse child elements to gather the source code for all
         Resource-based classes which are defined in the main scope.
         """
 
+        # Start a new dict for each traversal, rather than sharing a default
+        if gathered_source is None:
+            gathered_source = dict()
+
         # If this element was not defined in the widgets module
         if not self.__class__.__module__.startswith('widget'):
 
-            # If this element has already been added
-            if self._name() in gathered_source:
-
-                # Insert the source at the end of the dict
-                # so that it is bumped to the top of the source code
-                src = gathered_source[self._name()]
-                del gathered_source[self._name()]
-                gathered_source[self._name()] = src
+            # Remove the element, if it has already been added
+            name = self._name()
+            src = gathered_source.pop(name, _MISSING)
 
             # If this element has not been added
-            else:
+            if src is _MISSING:
+
+                # Render its source
+                src = self.source_self()
 
-                # Add it
-                gathered_source[self._name()] = self.source_self()
+            # Insert the source at the end of the dict
+            # so that it is bumped to the top of the source code
+            gathered_source[name] = src
 
             # Recursively add the parent element
             p = self._parent_class()()
@@ -440,11 +500,7 @@ class Resource:
 
         # Iterate through functions defined for this class
         # and join their source code
-        return "\n\n".join([
-            getsource(val)
-            for _, val in self.__class__.__dict__.items()
-            if isfunction(val)
-        ])
+        return _class_functions_source(self.__class__)
 
     def _source_val(self, val, indent=4) -> Any:
         """
@@ -470,33 +526,45 @@ class Resource:
     # GET/SET ATTRIBUTES #
     ######################
     def _get_child(self, child_id, *cont) -> 'Resource':
-        """Return the child Resource with a corresponding id."""
+        """
+        Return the child Resource with a corresponding id.
+        Additional ids are resolved as further levels of nesting,
+        with a single dict lookup for each level.
+        """
 
-        # Get the child resource
-        r = self._children_dict.get(child_id)
+        # Start from this element
+        r = self
 
-        # If no key exists for child_id
-        if r is None:
-            msg = f"No child resource exists within {self.id}: {child_id}"
-            raise ResourceExecutionException(msg)
+        # Walk down one level of nesting for each id in the path
+        for cid in (child_id, *cont):
 
-        # If additional levels of nesting were specified
-        if len(cont) > 0:
-            # Recursively call the same function
-            return r._get_child(*cont)
-        # If no additional levels were requested
-        else:
-            # Return the element
-            return r
+            # Get the child resource
+            child = r._children_dict.get(cid)
+
+            # If no key exists for the id
+            if child is None:
+                msg = f"No child resource exists within {r.id}: {cid}"
+                raise ResourceExecutionException(msg)
+
+            r = child
+
+        # Return the element
+        return r
 
     def _find_child(self, id) -> Generator['Resource', None, None]:
         """Yield all nested child elements with the matching id."""
 
-        if self.id == id:
-            yield self
+        # Walk the tree with a single stack (in the same order as a
+        # recursive walk), rather than nesting a generator at every level
+        stack = [self]
+        while stack:
+            r = stack.pop()
 
-        for child in self.children:
-            yield from child._find_child(id)
+            if r.id == id:
+                yield r
+
+            # Children are added in reverse so that the first is visited next
+            stack.extend(reversed(r.children))
 
     def get(
         self,
@@ -530,20 +598,15 @@ class Resource:
     def get_attr(self, attr, **kwargs) -> Any:
         """Return the value of the attribute for this resource."""
 
-        # First get the attribute defined in the object
-        if attr in self.__dict__:
-            return self.__dict__.get(attr)
+        # Get the attribute defined in the object or its class
+        val = getattr(self, attr, _MISSING)
 
-        else:
+        # If it isn't present in either place, raise an error
+        if val is _MISSING:
+            msg = f"Attribute does not exist {attr} for {self.id}"
+            raise ResourceExecutionException(msg)
 
-            # Next try to get the attribute defined in the class
-            if attr in self.__class__.__dict__:
-                return self.__class__.__dict__.get(attr)
-
-            # If it isn't present in either place, raise an error
-            else:
-                msg = f"Attribute does not exist {attr} for {self.id}"
-                raise ResourceExecutionException(msg)
+        return val
 
     def get_value(self, **kwargs) -> Any:
         """
@@ -596,7 +659,7 @@ class Resource:
     def set_attr(self, attr, val, **kwargs) -> None:
         """Set the value of an attribute for this resource."""
 
-        self.__dict__[attr] = val
+        setattr(self, attr, val)
 
     def set_value(self, val, **kwargs) -> None:
         """Set the value of the 'value' attribute for this resource."""
@@ -632,7 +695,8 @@ class Resource:
         if len(path) > 0:
 
             # The first element in the path must be a child .id
-            child_id = path.pop(0)
+            # (the list provided is not modified)
+            child_id, *path = path
 
             # Get the resource
             r = self._get_child(child_id)
@@ -669,9 +733,13 @@ class Resource:
                 # Just return the value from .get_value()
                 return self.get_value(**kwargs)
 
-    def _flatten(self, values: dict, _running={}):
+    def _flatten(self, values: dict, _running: Union[dict, None] = None):
         """Internal method to flatten the values of a dict."""
 
+        # Start a new dict for each traversal, rather than sharing a default
+        if _running is None:
+            _running = dict()
+
         for kw, val in values.items():
 
             if isinstance(val, dict):
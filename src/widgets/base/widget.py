@@ -61,8 +61,7 @@ class Widget(Resource):
                 raise WidgetFunctionException(msg)
 
             # Write out to the file
-            with open(fp, "w") as handle:
-                handle.write(text)
+            fp.write_text(text, encoding="utf-8")
 
     def download_html_button(self):
         """
@@ -5,6 +5,24 @@ from widgets.base.exceptions import ResourceExecutionException
 from widgets.base.resource import Resource
 
 
+def _reset_key_prefixes(resource: Resource) -> None:
+    """
+    Reset the cached key prefix for every StResource nested within
+    a resource (including the resource itself), passing through
+    any child elements which are not StResources.
+    """
+
+    stack = [resource]
+    while stack:
+        r = stack.pop()
+
+        if isinstance(r, StResource):
+            r._key_prefix = None
+            r._key = None
+
+        stack.extend(r.children)
+
+
 class StResource(Resource):
     """
     Base class for Streamlit-based resources.
@@ -39,6 +57,14 @@ class StResource(Resource):
     # Parent element (if any)
     parent: Union['StResource', None] = None
 
+    # Cached prefix of the UI key (the path of ids to the root element),
+    # which is reset whenever the id or the parent of an element changes
+    _key_prefix: Union[str, None] = None
+
+    # Cached UI key, along with the revision it was formatted for
+    _key: Union[str, None] = None
+    _key_revision: Union[int, None] = None
+
     def __init__(
         self,
         id="resource",
@@ -81,7 +107,48 @@ class StResource(Resource):
     def key(self):
         """Format a unique UI key based on the id and ui revision."""
 
-        return f"{'_'.join(self._path_to_root())}_{self.revision}"
+        # Only format a new key if the revision has changed
+        # (or the key prefix has been reset)
+        if self._key is None or self._key_revision != self.revision:
+            self._key = f"{self._cached_key_prefix()}_{self.revision}"
+            self._key_revision = self.revision
+
+        return self._key
+
+    def _cached_key_prefix(self) -> str:
+        """
+        Return the path of ids to the root element, joined as a string.
+        The value is computed once and reused until the id or the
+        parent of this element (or any of its parents) changes.
+        """
+
+        if self._key_prefix is None:
+            self._key_prefix = '_'.join(self._path_to_root())
+
+        return self._key_prefix
+
+    def _reset_key_prefix(self) -> None:
+        """Reset the cached key prefix for this element and its children."""
+
+        _reset_key_prefixes(self)
+
+    def _attach_child(self, child: Resource):
+        """Attach a Resource as a child."""
+
+        super()._attach_child(child)
+
+        # The path to the root has changed for the child element
+        # (and for any StResource nested within it)
+        _reset_key_prefixes(child)
+
+    def set_attr(self, attr, val, **kwargs) -> None:
+        """Set the value of an attribute for this resource."""
+
+        super().set_attr(attr, val, **kwargs)
+
+        # Changing the id or parent changes the path to the root
+        if attr in ("id", "parent"):
+            self._reset_key_prefix()
 
     def prep(self):
         """
@@ -160,10 +160,12 @@ class StDuplicator(wist.StResource):
         """
 
         # Add the value to the session state
-        if st.session_state.get(self.key()) is None:
-            st.session_state[self.key()] = self.value
+        key = self.key()
+        value = st.session_state.get(key)
+        if value is None:
+            st.session_state[key] = self.value
         else:
-            self.value = st.session_state[self.key()]
+            self.value = value
 
         for ix, resource in enumerate(self.children):
 
@@ -268,5 +270,7 @@ class StDuplicator(wist.StResource):
     def _toggle_element(self, ix):
         """Toggle the show/hide status of an element."""
 
-        st.session_state[self.key()][ix] = not st.session_state[self.key()][ix]
-        self.value = st.session_state[self.key()]
+        # Look up the list of show/hide flags in the session state once
+        value = st.session_state[self.key()]
+        value[ix] = not value[ix]
+        self.value = value
@@ -68,22 +68,24 @@ class StFile(StValue):
 
             # Increment the UI revision
             self.revision += 1
+            key = self.key()
 
             # Update the input element
             self.ui_container().file_uploader(
                 self.label,
                 accept_multiple_files=self.accept_multiple_files,
                 help=self.help,
-                key=self.key(),
+                key=key,
                 disabled=self.disabled,
                 label_visibility=self.label_visibility
             )
 
             # If a file was provided
-            if st.session_state[self.key()] is not None:
+            files = st.session_state[key]
+            if files is not None:
 
                 # Run the function used to parse the file(s)
-                self.parse_files(st.session_state[self.key()])
+                self.parse_files(files)
 
     def parse_files(self, files):
         """Stub used by derivative classes to parse the file inputs."""
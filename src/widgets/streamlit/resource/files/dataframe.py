@@ -1,9 +1,67 @@
+from collections import OrderedDict
+import hashlib
+from io import BytesIO
+from threading import Lock
 from typing import Union
 import pandas as pd
 from widgets.base.helpers import parse_dataframe_string
 from widgets.base.helpers import encode_dataframe_string
 from widgets.streamlit.resource.files.base import StFile
 
+# Maximum number of parsed uploads which are kept in memory
+PARSED_CACHE_SIZE = 8
+
+# DataFrames parsed from uploaded files, keyed on a hash of the file
+# contents and the arguments used to read them (least recently used first)
+_PARSED_CACHE = OrderedDict()
+
+# The cache is shared by the threads of every Streamlit session
+_PARSED_CACHE_LOCK = Lock()
+
+
+def _read_csv_cached(files, kwargs: dict) -> pd.DataFrame:
+    """
+    Read an uploaded file with pd.read_csv, reusing the result
+    if a file with the same contents was already parsed with
+    the same arguments.
+
+    Note that up to PARSED_CACHE_SIZE parsed uploads (from any session)
+    are kept in memory for the life of the process.
+    """
+
+    # If the contents of the file cannot be read directly, just parse it
+    if not hasattr(files, "getvalue"):
+        return pd.read_csv(files, **kwargs)
+
+    data = files.getvalue()
+    cache_key = (
+        hashlib.blake2b(data, digest_size=16).digest(),
+        repr(kwargs)
+    )
+
+    # If the same contents were parsed before
+    with _PARSED_CACHE_LOCK:
+        df = _PARSED_CACHE.get(cache_key)
+
+        # Mark the entry as the most recently used
+        if df is not None:
+            _PARSED_CACHE.move_to_end(cache_key)
+
+    # Otherwise, parse the contents (without holding the lock,
+    # so that other sessions are not blocked) and add them to the cache
+    if df is None:
+        df = pd.read_csv(BytesIO(data), **kwargs)
+
+        with _PARSED_CACHE_LOCK:
+            _PARSED_CACHE[cache_key] = df
+
+            # Drop the least recently used entries
+            while len(_PARSED_CACHE) > PARSED_CACHE_SIZE:
+                _PARSED_CACHE.popitem(last=False)
+
+    # Return a copy, so that the cached table cannot be modified in place
+    return df.copy()
+
 
 class StDataFrame(StFile):
     """DataFrame resource used in a Streamlit-based widget."""
@@ -11,6 +69,11 @@ class StDataFrame(StFile):
     value = pd.DataFrame()
     kwargs = dict()
 
+    # Signature of the last uploaded file which was parsed,
+    # along with a copy of the DataFrame which was read from it
+    _parsed_signature: Union[tuple, None] = None
+    _parsed_value: Union[pd.DataFrame, None] = None
+
     def __init__(
         self,
         id="dataframe",
@@ -32,6 +95,13 @@ class StDataFrame(StFile):
                             elements.
             value:          (optional) The starting Pandas DataFrame.
             kwargs (dict):  Additional keyword arguments passed to pd.read_csv.
+                            For large files, kwargs=dict(engine="pyarrow")
+                            will use the multi-threaded pyarrow parser
+                            (if pyarrow is installed).
+                            Declaring the column types with dtype=, and
+                            reading only the needed columns with usecols=,
+                            avoids inferring types from the whole file and
+                            reduces the time and memory needed to parse it.
             disabled (bool):  (optional) If True, the input element is
                             disabled (default: False)
             label_visibility: (optional) The visibility of the label.
@@ -68,10 +138,36 @@ class StDataFrame(StFile):
     def parse_files(self, files):
         """Parse any tabular data files uploaded by the user."""
 
+        # If the same file was already parsed (with the same arguments),
+        # and the value has not been replaced or modified since,
+        # keep that DataFrame
+        signature = self._file_signature(files)
+        if (
+            signature == self._parsed_signature and
+            isinstance(self.value, pd.DataFrame) and
+            self.value.equals(self._parsed_value)
+        ):
+            return
+
         # Read the file as a DataFrame
-        self.value = pd.read_csv(
-            files,
-            **self.kwargs
+        self.value = _read_csv_cached(files, self.kwargs)
+
+        # Keep track of the file which was parsed, along with a copy
+        # of its contents (so that any change in place is detected)
+        self._parsed_signature = signature
+        self._parsed_value = self.value.copy()
+
+    def _file_signature(self, files) -> tuple:
+        """
+        Identify an uploaded file by its id, name and size,
+        along with the arguments used to read it.
+        """
+
+        return (
+            getattr(files, "file_id", None),
+            getattr(files, "name", None),
+            getattr(files, "size", None),
+            repr(self.kwargs)
         )
 
     def _source_val(self, val, **kwargs):
@@ -1,8 +1,27 @@
+from functools import lru_cache
 import streamlit as st
+from typing import Union
 from widgets.base.exceptions import ResourceConfigurationException
 from widgets.base.helpers import compress_json, decompress_json
 from widgets.st_base.value import StValue
 
+# Lists of options shorter than this are written out as plain lists,
+# since compressing (and hex-encoding) a short list makes it longer
+COMPRESSION_THRESHOLD = 16
+
+
+@lru_cache(maxsize=512)
+def _compress_options(typed_options: tuple) -> str:
+    """
+    Compress a set of options, reusing the result for any
+    set of options which has already been compressed.
+    The options are provided as (type, value) pairs so that
+    equal values of different types (e.g. 1 and True) are
+    not confused in the cache.
+    """
+
+    return compress_json([val for _, val in typed_options])
+
 
 class StSelectString(StValue):
     """
@@ -13,6 +32,9 @@ class StSelectString(StValue):
     options: list = []
     index: int = 0
 
+    # The (options, value, index) state which was last resolved
+    _last_resolved: Union[tuple, None] = None
+
     def __init__(
         self,
         id=None,
@@ -21,7 +43,7 @@ class StSelectString(StValue):
         help=None,
         disabled: bool = False,
         label_visibility: str = "visible",
-        options: list = [],
+        options: Union[list, str, None] = None,
         index: int = 0,
         sidebar=True,
         **kwargs
@@ -57,9 +79,14 @@ class StSelectString(StValue):
             StSelectString: The instantiated resource object.
         """
 
-        # Parse the provided options, converting from a gzip-compressed
-        # string if necessary
-        options = decompress_json(options)
+        # If no options were provided, start with an empty list
+        if options is None:
+            options = []
+
+        # Otherwise parse the provided options, converting from a
+        # gzip-compressed string if necessary
+        elif isinstance(options, str):
+            options = decompress_json(options)
 
         # Set up the resource attributes
         super().__init__(
@@ -94,25 +121,29 @@ class StSelectString(StValue):
                 msg = f"Resource {self.id} must have an index defined"
                 raise ResourceConfigurationException(msg)
 
-            # The index must be a valid indeger
-            if self.index < 0 or (len(self.options) > 0 and self.index >= len(self.options)): # noqa
+            n_options = len(self.options)
+
+            # The index must be a valid integer
+            # (any non-negative index is accepted while there are no options)
+            if not (0 <= self.index < n_options or (n_options == 0 and self.index >= 0)): # noqa
                 msg = f"Resource {self.id} must have an index defined in the valid range" # noqa
                 raise ResourceConfigurationException(msg)
 
             # Set the value using the index position from the list
-            if self.index < len(self.options):
+            if n_options > 0:
                 self.value = self.options[self.index]
 
         # If the value attribute was provided
         elif self.value is not None:
 
             # The value must be present in the list of options
-            if self.value not in self.options:
+            index = self._option_index(self.value)
+            if index is None:
                 msg = f"Default ({self.value} [{type(self.value)}]) not found in list of options: {', '.join(self.options)}" # noqa
                 raise ResourceConfigurationException(msg)
 
             # Set the index position of the default element
-            self.index = self.options.index(self.value)
+            self.index = index
 
     def run_self(self):
         """
@@ -122,10 +153,13 @@ class StSelectString(StValue):
         # Increment the UI revision
         self.revision += 1
 
-        # Make sure to resolve the index
-        if self.value not in self.options and len(self.options) > 0:
-            self.value = self.options[0]
-        self._resolve_index()
+        # Make sure to resolve the index, unless the options, value
+        # and index are all unchanged since they were last resolved
+        if not self._is_resolved():
+            if self._option_index(self.value) is None and len(self.options) > 0: # noqa
+                self.value = self.options[0]
+            self._resolve_index()
+            self._last_resolved = self._resolved_state()
 
         # Update the input element
         self.ui_container().selectbox(
@@ -141,6 +175,41 @@ class StSelectString(StValue):
 
         self.on_change()
 
+    def _resolved_state(self) -> tuple:
+        """Summarize the attributes which are checked by _resolve_index()."""
+
+        # Keep a copy of the options, so that any change made
+        # to the list in place is also detected
+        return (list(self.options), self.value, self.index)
+
+    def _is_resolved(self) -> bool:
+        """
+        Return True if the options, value and index are unchanged since
+        they were last resolved.
+        """
+
+        if self._last_resolved is None:
+            return False
+
+        options, value, index = self._last_resolved
+
+        return (
+            value == self.value and
+            index == self.index and
+            options == self.options
+        )
+
+    def _option_index(self, value) -> Union[int, None]:
+        """
+        Return the index position of a value in the list of options,
+        or None if it is not present.
+        """
+
+        try:
+            return self.options.index(value)
+        except ValueError:
+            return None
+
     def on_change(self):
         """Function called when the selectbox is changed."""
 
@@ -149,14 +218,46 @@ class StSelectString(StValue):
 
         if self.value is not None:
             # Update the starting index position (used in update_ui())
-            self.index = self.options.index(self.value)
+            self.index = self._option_index(self.value)
 
     def _source_val(self, val, **kwargs):
         """
-        Use gzip encoding for any list elements
+        Use gzip encoding for any list elements, unless the list is
+        short enough that it is more compact to write it out directly.
+        Strings are written with their repr, so that any quotes
+        or backslashes are escaped.
         """
 
         if isinstance(val, list):
-            return compress_json(val)
+            if len(val) < COMPRESSION_THRESHOLD:
+                return self._source_list(val, **kwargs)
+
+            # Options which cannot be hashed are compressed directly
+            try:
+                return _compress_options(
+                    tuple((type(i), i) for i in val)
+                )
+            except TypeError:
+                return compress_json(val)
+
+        # Use the repr of the selected string, which escapes any quotes
+        elif isinstance(val, str):
+            return repr(str(val))
         else:
             return super()._source_val(val, **kwargs)
+
+    def _source_list(self, val: list, **kwargs) -> str:
+        """
+        Write out a list of options directly, using the repr of
+        any strings so that quotes and backslashes are escaped
+        (numpy string scalars are converted to plain strings first).
+        """
+
+        # Any other values use the default formatting
+        source_val = super()._source_val
+
+        return "[" + ", ".join([
+            repr(str(i)) if isinstance(i, str)
+            else str(source_val(i, **kwargs))
+            for i in val
+        ]) + "]"
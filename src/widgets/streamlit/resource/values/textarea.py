@@ -91,9 +91,12 @@ class StTextArea(StValue):
         self.on_change()
 
     def _source_val(self, val, indent=4) -> Any:
-        """Triple quote strings to wrap new lines."""
+        """
+        Use the repr of strings, which escapes any new lines or quotes
+        (including triple quotes) contained in the text.
+        """
 
         if isinstance(val, str):
-            return f'"""{val}"""'
+            return repr(str(val))
         else:
             return super()._source_val(val, indent)
@@ -1,14 +1,93 @@
+import atexit
+from collections.abc import Callable
+from functools import lru_cache, partial
 from importlib.metadata import PackageNotFoundError, version
-from tempfile import _TemporaryFileWrapper, NamedTemporaryFile
+import os
+from tempfile import mkstemp
 from pathlib import Path
 import streamlit as st
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Union, get_args, get_origin
 from widgets.base.exceptions import WidgetFunctionException
 from widgets.base.widget import Widget
 from widgets.base.helpers import render_template
 from widgets.st_base.resource import StResource
 import widgets
 
+# Pinned requirement for this library, added to every HTML widget
+_WIDGETS_LIB_REQUIREMENT = f"widgets-lib=={widgets.__version__}"
+
+
+@lru_cache(maxsize=None)
+def _deferred_download_data() -> bool:
+    """
+    Return True if st.download_button accepts a callable as its data,
+    so that the file contents are only generated when it is clicked.
+    """
+
+    try:
+        from streamlit.elements.widgets.button import DownloadButtonDataType
+    except ImportError:
+        return False
+
+    # Check whether a callable is one of the accepted types of data
+    return any(
+        get_origin(data_type) is Callable
+        for data_type in get_args(DownloadButtonDataType)
+    )
+
+
+@lru_cache(maxsize=None)
+def _pinned_module_version(module: str) -> str:
+    """
+    Return the module name pinned to its installed version.
+    The installed versions do not change while the library is running,
+    so each package metadata lookup is only made once.
+    """
+
+    try:
+        module_ver = version(module)
+    except PackageNotFoundError:
+        msg = f"Module is not installed: {module}"
+        raise WidgetFunctionException(msg)
+
+    return f"{module}=={module_ver}"
+
+
+# Number of rendered widget scripts and HTML files which are kept in memory
+RENDERED_CACHE_SIZE = 4
+
+
+@lru_cache(maxsize=RENDERED_CACHE_SIZE)
+def _render_widget_template(template_name: str, **kwargs) -> str:
+    """
+    Render the template for a widget script or HTML file.
+    The output is reused for as long as the widget source and settings
+    are unchanged (e.g. across reruns of the download buttons).
+    All keyword arguments must be hashable, and so any lists
+    are passed in as tuples (and rendered as lists).
+
+    Note that the most recent RENDERED_CACHE_SIZE outputs (from any
+    session) are kept in memory for the life of the process, including
+    the source of each widget along with any data embedded in it.
+    """
+
+    return render_template(
+        template_name,
+        **{
+            kw: list(val) if isinstance(val, tuple) else val
+            for kw, val in kwargs.items()
+        }
+    )
+
+
+def _remove_file(path: str) -> None:
+    """Remove a file, if it still exists."""
+
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
 
 class StreamlitWidget(StResource, Widget):
     """
@@ -87,20 +166,26 @@ class StreamlitWidget(StResource, Widget):
 
     def run_cli(
         self,
-        args: List[str] = [],
-        flag_options: Dict[str, Any] = {},
+        args: Union[List[str], None] = None,
+        flag_options: Union[Dict[str, Any], None] = None,
         title="Widget"
     ) -> None:
         """
         Run the widget from the command line.
         """
 
-        # Make a copy of this widget in a tempfile
-        with self._script_tempfile(title=title) as script:
+        # Start from empty arguments, rather than sharing a default
+        if args is None:
+            args = []
+        if flag_options is None:
+            flag_options = {}
+
+        # Make a copy of this widget in a script file
+        script = self._script_file(title=title)
 
-            # Launch the script with Streamlit
-            from streamlit.web.cli import _main_run
-            _main_run(script.name, args, flag_options=flag_options)
+        # Launch the script with Streamlit
+        from streamlit.web.cli import _main_run
+        _main_run(script, args, flag_options=flag_options)
 
     def clone_button(
             self,
@@ -130,15 +215,21 @@ class StreamlitWidget(StResource, Widget):
 
         if st.session_state.get("_ready_to_clone", False):
 
+            name = self._name()
+
+            # Generate the source code once for both downloads
+            widget_source = self.source_all()
+
             if as_html:
                 button_container.download_button(
                     "Download HTML",
                     self._render_html(
-                        title=self._name(),
+                        title=name,
                         layout=self.layout,
-                        initial_sidebar_state=self.initial_sidebar_state
+                        initial_sidebar_state=self.initial_sidebar_state,
+                        widget_source=widget_source
                     ),
-                    file_name=f"{self._name()}.html",
+                    file_name=f"{name}.html",
                     mime="text/html",
                     help="Download this widget as a webpage (HTML)",
                     use_container_width=True,
@@ -148,8 +239,8 @@ class StreamlitWidget(StResource, Widget):
             if as_script:
                 button_container.download_button(
                     "Download Script",
-                    self._render_script(),
-                    file_name=f"{self._name()}.py",
+                    self._render_script(widget_source=widget_source),
+                    file_name=f"{name}.py",
                     mime="text/x-python",
                     help="Download this widget as a script (Python)",
                     use_container_width=True,
@@ -183,14 +274,20 @@ class StreamlitWidget(StResource, Widget):
             empty=False
         ).columns(3)
 
+        name = self._name()
+
         col2.download_button(
             "Download HTML",
-            self._render_html(
-                title=self._name(),
+            self._download_data(
+                self._render_html,
+                title=name,
                 layout=self.layout,
-                initial_sidebar_state=self.initial_sidebar_state
+                initial_sidebar_state=self.initial_sidebar_state,
+                # Pin the requirements now, so that any error is shown
+                # in the app (rather than when the button is clicked)
+                requirements=self._pinned_requirements()
             ),
-            file_name=f"{self._name()}.html",
+            file_name=f"{name}.html",
             mime="text/html",
             help="Download this widget as a webpage (HTML)",
             use_container_width=True
@@ -208,52 +305,79 @@ class StreamlitWidget(StResource, Widget):
 
         col2.download_button(
             "Download Script",
-            self._render_script(),
+            self._download_data(self._render_script),
             file_name=f"{self._name()}.py",
             mime="text/x-python",
             help="Download this widget as a script (Python)",
             use_container_width=True
         )
 
-    def _render_script(self, title="Widget") -> str:
+    def _download_data(self, render, **kwargs):
+        """
+        Return the data for a download button, which is either
+        a function generating the file contents when the button is
+        clicked (if supported by streamlit), or the contents themselves.
+        Any error raised by a deferred function is only logged by
+        streamlit, and so anything which may fail because of the
+        configuration of the widget should be passed in as kwargs.
+        """
+
+        if _deferred_download_data():
+            return partial(render, **kwargs)
+        else:
+            return render(**kwargs)
+
+    def _render_script(
+        self,
+        title="Widget",
+        widget_source: Union[str, None] = None
+    ) -> str:
         """
         Return the script for this widget as a string.
+        The output of source_all() may be provided if it was
+        already generated.
         """
 
+        if widget_source is None:
+            widget_source = self.source_all()
+
         if self.disable_sidebar:
             initial_sidebar_state = "collapsed"
         else:
             initial_sidebar_state = self.initial_sidebar_state
 
         # Render the template for this script
-        script = render_template(
+        script = _render_widget_template(
             "streamlit_single.py.j2",
             title=title if len(self.title) == 0 else self.title,
             layout=self.layout,
             initial_sidebar_state=initial_sidebar_state,
             imports=self._imports(),
-            widget_source=self.source_all(),
+            widget_source=widget_source,
             widget_name=self._name()
         )
 
         return script
 
-    def _script_tempfile(self, title="Widget") -> _TemporaryFileWrapper:
+    def _script_file(self, title="Widget") -> str:
         """
-        Return a temporary file object which contains a script for this widget.
+        Write the script for this widget to a new temporary file,
+        and return its path.
+        The file is only readable by the current user, and it is
+        removed when the process exits.
         """
 
-        # Make a temporary file
-        fp = NamedTemporaryFile(mode="w+t", prefix="script", suffix=".py")
+        # Make a temporary file with a unique name
+        fd, path = mkstemp(prefix="script", suffix=".py")
 
-        # Write out the script
-        fp.write(self._render_script(title=title))
+        # Remove the file when the process exits
+        atexit.register(_remove_file, path)
 
-        # Move the pointer back to the top
-        fp.seek(0)
+        # Write out the script in a single call
+        with open(fd, "wb") as handle:
+            handle.write(self._render_script(title=title).encode("utf-8"))
 
-        # Return the file object
-        return fp
+        return path
 
     def to_html(
         self,
@@ -290,7 +414,7 @@ class StreamlitWidget(StResource, Widget):
     def _imports(self) -> str:
         """Return the imports needed by this widget."""
 
-        return "\n".join(["\n".join(self.imports), "\n".join(self.extra_imports)]) # noqa
+        return "\n".join((*self.imports, *self.extra_imports))
 
     def _render_html(
         self,
@@ -298,16 +422,20 @@ class StreamlitWidget(StResource, Widget):
         layout="centered",
         initial_sidebar_state="auto",
         stlite_ver="0.31.0",
+        widget_source: Union[str, None] = None,
+        requirements: Union[tuple, None] = None
     ):
-        """Render the widget as HTML"""
+        """
+        Render the widget as HTML.
+        The output of source_all() and _pinned_requirements() may be
+        provided if they were already generated.
+        """
 
-        # Pin the version of all requirements
-        requirements = [
-            self._pin_module_version(module)
-            for module in self.requirements
-        ] + [
-            f"widgets-lib=={widgets.__version__}"
-        ]
+        if widget_source is None:
+            widget_source = self.source_all()
+
+        if requirements is None:
+            requirements = self._pinned_requirements()
 
         # Set up the contents of the HTML
         kwargs = dict(
@@ -317,7 +445,7 @@ class StreamlitWidget(StResource, Widget):
             stlite_ver=stlite_ver,
             requirements=requirements,
             imports=self._imports(),
-            widget_source=self.source_all().replace("\\", "\\\\"),
+            widget_source=widget_source.replace("\\", "\\\\"),
             widget_name=self._name()
         )
 
@@ -329,13 +457,26 @@ class StreamlitWidget(StResource, Widget):
             kwargs['ga_tag'] = self.ga_tag
 
         # Render the template for this HTML
-        html = render_template(
+        html = _render_widget_template(
             template,
             **kwargs
         )
 
         return html
 
+    def _pinned_requirements(self) -> tuple:
+        """
+        Pin the version of all requirements
+        (as a tuple, so that the rendered HTML can be cached).
+        """
+
+        return tuple(
+            self._pin_module_version(module)
+            for module in self.requirements
+        ) + (
+            _WIDGETS_LIB_REQUIREMENT,
+        )
+
     def _pin_module_version(self, module):
         """
         Pin a module version, if possible.
@@ -346,10 +487,4 @@ class StreamlitWidget(StResource, Widget):
         if module in self.pyodide_requirements:
             return module
 
-        try:
-            module_ver = version(module)
-        except PackageNotFoundError:
-            msg = f"Module is not installed: {module}"
-            raise WidgetFunctionException(msg)
-
-        return f"{module}=={module_ver}"
+        return _pinned_module_version(module)
@@ -112,8 +112,11 @@ class SimpleWidget(wist.StreamlitWidget):
         # If a table has been uploaded
         if df is not None and df.shape[0] > 0:
 
+            # Get the list of column names once
+            columns = df.columns.tolist()
+
             # Update the options for the x_col, y_col, and label_col variables
-            self.update_options(df.columns.values)
+            self.update_options(columns)
 
             # After making that update, get the complete set of values
             # It is a nuance of streamlit that this object will not be
@@ -125,7 +128,7 @@ class SimpleWidget(wist.StreamlitWidget):
                 data_frame=df,
                 x=vals["x_col"],
                 y=vals["y_col"],
-                hover_data=df.columns.values,
+                hover_data=columns,
                 labels={
                     vals["x_col"]: vals["x_label"],
                     vals["y_col"]: vals["y_label"]
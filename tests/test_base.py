@@ -1,9 +1,11 @@
-from copy import deepcopy
+import gc
 import unittest
+from weakref import ref
 from widgets.base.exceptions import ResourceConfigurationException
 from widgets.base.exceptions import WidgetFunctionException
 from widgets.base.exceptions import ResourceExecutionException
 from widgets.base.resource import Resource
+from widgets.base.resource import _class_functions_source
 from widgets.base.widget import Widget
 import widgets
 
@@ -64,6 +66,23 @@ class TestResources(unittest.TestCase):
             lambda: r.get("missing_attribute")
         )
 
+    def test_class_attribute(self):
+
+        class ParentResource(Resource):
+            foo = "bar"
+
+        class ChildResource(ParentResource):
+            pass
+
+        # Attributes defined on any parent class can be accessed
+        r = ChildResource(id="test")
+        self.assertEqual(r.get(attr="foo"), "bar")
+
+        # Setting the attribute only modifies the object
+        r.set(attr="foo", value="BAR")
+        self.assertEqual(r.get(attr="foo"), "BAR")
+        self.assertEqual(ChildResource.foo, "bar")
+
     def test_isinstance(self):
 
         # Define a resource
@@ -86,25 +105,24 @@ class TestResources(unittest.TestCase):
 
     def setup_example_resource(self):
 
-        return deepcopy(
-            Resource(
-                id='top_list',
-                children=[
-                    Resource(id='first_resource', value='foo'),
-                    Resource(
-                        id='second_list',
-                        children=[
-                            Resource(id='second_resource', value='bar'),
-                            Resource(
-                                id='third_list',
-                                children=[
-                                    Resource(id='third_resource', value='howdy') # noqa
-                                ]
-                            )
-                        ]
-                    )
-                ]
-            )
+        # Each call builds a new set of Resources, so none are shared
+        return Resource(
+            id='top_list',
+            children=[
+                Resource(id='first_resource', value='foo'),
+                Resource(
+                    id='second_list',
+                    children=[
+                        Resource(id='second_resource', value='bar'),
+                        Resource(
+                            id='third_list',
+                            children=[
+                                Resource(id='third_resource', value='howdy') # noqa
+                            ]
+                        )
+                    ]
+                )
+            ]
         )
 
     def test_child_value_assignment(self):
@@ -195,7 +213,9 @@ class TestResources(unittest.TestCase):
         self.assertEqual(v['second_list']['third_list']['third_resource'], 'HOWDY') # noqa
 
         # Get all of the values after the first one
-        v = r.all_values(path=['second_list'])
+        path = ['second_list']
+        v = r.all_values(path=path)
+        self.assertEqual(path, ['second_list'])
         self.assertEqual(v['second_resource'], 'BAR')
         self.assertEqual(v['third_list']['third_resource'], 'HOWDY')
 
@@ -205,6 +225,10 @@ class TestResources(unittest.TestCase):
         self.assertEqual(v['second_resource'], 'BAR')
         self.assertEqual(v['third_resource'], 'HOWDY')
 
+        # Values are not shared between calls to _flatten
+        self.assertEqual(r._flatten(dict(a=1)), dict(a=1))
+        self.assertEqual(r._flatten(dict(b=2)), dict(b=2))
+
         # Define a resource which cannot be flattened
         r = Resource(
             children=[
@@ -419,6 +443,26 @@ class TestWidget(unittest.TestCase):
             w._source_attributes()
         )
 
+    def test_source_functions_released(self):
+
+        class TemporaryWidget(ExampleWidget):
+
+            def run_self(self):
+                pass
+
+        # The source of the functions is read for the class
+        self.assertIn(
+            "def run_self",
+            _class_functions_source(TemporaryWidget)
+        )
+
+        # Caching the source does not keep the class alive
+        # (e.g. the classes defined in __main__ by every rerun)
+        cls_ref = ref(TemporaryWidget)
+        del TemporaryWidget
+        gc.collect()
+        self.assertIsNone(cls_ref())
+
 
 if __name__ == '__main__':
     unittest.main()
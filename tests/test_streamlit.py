@@ -1,10 +1,18 @@
+from ast import literal_eval
+from io import BytesIO
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 import pandas as pd
+import streamlit as st
 import unittest
+from unittest.mock import patch
 from widgets.base.exceptions import ResourceConfigurationException
+from widgets.base.exceptions import WidgetFunctionException
 from widgets.base.io import load_widget
+from widgets.base.resource import Resource
 import widgets.streamlit as wist
+from widgets.streamlit.widget.base import _deferred_download_data
+from widgets.streamlit.widget.base import _render_widget_template
 
 
 class TestStreamlitResources(unittest.TestCase):
@@ -60,6 +68,58 @@ class TestStreamlitResources(unittest.TestCase):
         # Make sure that the values are equal
         self.assertTrue(df.equals(res.value))
 
+    def test_dataframe_source_val(self):
+
+        for df in [
+            pd.DataFrame(dict(a=range(100), b=range(100))),
+            pd.DataFrame(dict(a=range(100), b=[0.5, None] * 50)),
+            pd.DataFrame(dict(a=range(100), b=['a', 'b'] * 50))
+        ]:
+            res = wist.StDataFrame(id="test_dataframe", value=df)
+
+            # The serialized value can be used to create the same DataFrame
+            encoded = literal_eval(res._source_val(res.value))
+            self.assertTrue(
+                df.equals(wist.StDataFrame(value=encoded).value)
+            )
+
+    def test_dataframe_parse_files(self):
+
+        class UploadedFile(BytesIO):
+            """Stand-in for the file object returned by st.file_uploader."""
+            name = "test.csv"
+            size = 12
+            file_id = "test_file_id"
+
+        res = wist.StDataFrame(id="test_dataframe")
+
+        # Parse an uploaded file
+        res.parse_files(UploadedFile(b"a,b\n1,2\n3,4\n"))
+        parsed = res.value
+        self.assertEqual(parsed.shape, (2, 2))
+
+        # Parsing the same file again keeps the same DataFrame
+        res.parse_files(UploadedFile(b"a,b\n1,2\n3,4\n"))
+        self.assertIs(res.value, parsed)
+
+        # If the value was replaced, the file is parsed again
+        res.set(value=pd.DataFrame(), update=False)
+        res.parse_files(UploadedFile(b"a,b\n1,2\n3,4\n"))
+        self.assertIsNot(res.value, parsed)
+        self.assertTrue(parsed.equals(res.value))
+
+        # If the value was modified in place, the file is parsed again
+        res.value.loc[0, "a"] = 99
+        res.parse_files(UploadedFile(b"a,b\n1,2\n3,4\n"))
+        self.assertEqual(res.value.loc[0, "a"], 1)
+
+        # Another resource reading the same contents gets its own copy
+        other = wist.StDataFrame(id="other_dataframe")
+        other.parse_files(UploadedFile(b"a,b\n1,2\n3,4\n"))
+        self.assertTrue(parsed.equals(other.value))
+        other.value.loc[0, "a"] = 0
+        self.assertEqual(res.value.loc[0, "a"], 1)
+
     def test_dataframe_exception(self):
 
         self.assertRaises(
@@ -134,6 +194,34 @@ class TestStreamlitResources(unittest.TestCase):
         msg = "Default float does not match"
         self.assertEqual(s.get_value(), 1.0, msg)
 
+    def test_key(self):
+
+        s = wist.StString(id="s")
+        self.assertEqual(s.key(), "s_0")
+
+        # The key reflects the path to the root once attached to a parent
+        r = wist.StResource(id="top", children=[s])
+        self.assertEqual(r._get_child("s").key(), "s_top_0")
+
+        # The key reflects any change to the revision
+        s.revision += 1
+        self.assertEqual(s.key(), "s_top_1")
+
+        # The key reflects any change to the id of a parent element
+        r.set(attr="id", value="new_top", update=False)
+        self.assertEqual(s.key(), "s_new_top_1")
+
+        # Including elements nested within a Resource which is not
+        # an StResource itself
+        s = wist.StString(id="s")
+        r = wist.StResource(
+            id="top",
+            children=[Resource(id="middle", children=[s])]
+        )
+        self.assertEqual(s.key(), "s_middle_top_0")
+        r.set(attr="id", value="new_top", update=False)
+        self.assertEqual(s.key(), "s_middle_new_top_0")
+
 
 class ExampleStreamlitWidget(wist.StreamlitWidget):
     """Simple widget used for testing purposes"""
@@ -232,6 +320,12 @@ class TestStreamlitWidget(unittest.TestCase):
             lambda: wist.StSelectString(id='test', value=None, index=-1)
         )
 
+        # Index must be within the list of options
+        self.assertRaises(
+            ResourceConfigurationException,
+            lambda: wist.StSelectString(id='test', options=['foo'], index=1)
+        )
+
         # Set the value from the index
         r = wist.StSelectString(options=['foo', 'bar'], index=1, id='test')
         self.assertEqual(r.get_value(), 'bar')
@@ -246,6 +340,50 @@ class TestStreamlitWidget(unittest.TestCase):
         r = wist.StSelectString(options=['foo', 'bar'], value='bar', id='test')
         self.assertEqual(r.index, 1)
 
+        # Index positions reflect any replacement of the options
+        self.assertIsNone(r._option_index('baz'))
+        r.set(attr="options", value=['baz', 'foo', 'bar'], update=False)
+        self.assertEqual(r._option_index('bar'), 2)
+
+        # Index positions also reflect any change to the options in place
+        r.options[2] = 'qux'
+        self.assertIsNone(r._option_index('bar'))
+        r.set(value='qux', update=False)
+        r._resolve_index()
+        self.assertEqual(r.index, 2)
+
+        # Changing the options in place means they must be resolved again
+        r._last_resolved = r._resolved_state()
+        self.assertTrue(r._is_resolved())
+        r.options[2] = 'bar'
+        self.assertFalse(r._is_resolved())
+
+    def test_select_string_source(self):
+
+        # Options containing quotes and backslashes are escaped in the source
+        options = ['a "quoted" choice', "it's", 'back\\slash', 'b']
+        r = wist.StSelectString(id='test', options=options, value='b')
+        self.assertEqual(literal_eval(r._source_val(r.options)), options)
+
+        # The source for the widget can be compiled
+        w = ExampleSelectStringWidget()
+        compile(w.source_all(), "<widget>", "exec")
+
+    def test_text_area_source(self):
+
+        # Text containing quotes, backslashes and new lines is escaped
+        text = 'a "quoted" line\nit\'s a back\\slash\n"""triple"""'
+        r = wist.StTextArea(id='test', value=text)
+        self.assertEqual(literal_eval(r._source_val(r.value)), text)
+
+        # The widget can be saved to a script and loaded again
+        w = ExampleTextAreaWidget()
+        w.set(path=["text"], value=text, update=False)
+        with NamedTemporaryFile(suffix=".py") as tmp:
+            w.to_script(Path(tmp.name))
+            saved_widget = load_widget(Path(tmp.name), "ExampleTextAreaWidget")
+            self.assertEqual(saved_widget().get(path=["text"]), text)
+
     def test_html(self):
         # Test if the to_html method returns a non-zero length string
 
@@ -258,6 +396,53 @@ class TestStreamlitWidget(unittest.TestCase):
         self.assertIsInstance(html, str)
         self.assertGreater(len(html), 0)
 
+    def test_render_cache(self):
+
+        w = ExampleStreamlitWidget()
+        _render_widget_template.cache_clear()
+
+        # Rendering the same widget again reuses the output
+        html = w.to_html()
+        self.assertEqual(w.to_html(), html)
+        info = _render_widget_template.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+        # Any change to the widget is rendered again
+        w.set(path=["s"], value="t", update=False)
+        self.assertNotEqual(w.to_html(), html)
+        self.assertEqual(_render_widget_template.cache_info().misses, 2)
+
+    def test_download_data(self):
+
+        # Callable data is detected if it is supported by st.download_button
+        self.assertEqual(
+            _deferred_download_data(),
+            "or callable" in st.download_button.__doc__
+        )
+
+        w = ExampleStreamlitWidget()
+        html = w.to_html()
+
+        for deferred in [True, False]:
+            with patch(
+                "widgets.streamlit.widget.base._deferred_download_data",
+                return_value=deferred
+            ):
+
+                # The HTML is either generated when clicked, or right away
+                data = w._download_data(w._render_html, title=w._name())
+                self.assertEqual(callable(data), deferred)
+                self.assertEqual(data() if deferred else data, html)
+
+                # Requirements which cannot be pinned raise an error
+                # while the button is rendered, in either case
+                w_missing = ExampleMissingRequirementWidget()
+                w_missing.prep()
+                self.assertRaises(
+                    WidgetFunctionException,
+                    w_missing.download_html_button
+                )
+
     def test_StDownloadDataFrame(self):
 
         # StDownloadDataFrame must have a target
@@ -334,6 +519,27 @@ class TestStreamlitWidget(unittest.TestCase):
             self.assertEqual(s.all_values(), {"selector": "bar"})
 
 
+class ExampleMissingRequirementWidget(ExampleStreamlitWidget):
+
+    requirements = ["not-an-installed-module"]
+
+
+class ExampleTextAreaWidget(wist.StreamlitWidget):
+
+    children = [wist.StTextArea(id='text', value='')]
+
+
+class ExampleSelectStringWidget(wist.StreamlitWidget):
+
+    children = [
+        wist.StSelectString(
+            id='select',
+            options=['a "quoted" choice', 'back\\slash'],
+            index=0
+        )
+    ]
+
+
 class ExampleSelectorWidget(wist.StreamlitWidget):
 
     children = [